@@ -0,0 +1,5 @@
+# Stubs for orjson (Python 3.6)
+
+from typing import Any, Union
+
+def loads(obj: Union[bytes, bytearray, memoryview, str]) -> Any: ...
@@ -27,7 +27,6 @@ import click
 import iocage.lib.errors
 import iocage.lib.Host
 import iocage.lib.Jail
-import iocage.lib.Logger
 import iocage.lib.Release
 import iocage.lib.ZFS
 
@@ -36,24 +35,19 @@ __rootcmd__ = True
 
 def validate_count(ctx, param, value):
     """Takes a string, removes the commas and returns an int."""
-    if isinstance(value, str):
-        try:
-            value = value.replace(",", "")
-
-            return int(value)
-        except ValueError:
-            logger = iocage.lib.Logger.Logger()
-            logger.error(f"{value} is not a valid integer.")
-            exit(1)
-    else:
-        return int(value)
+    count = value.replace(",", "") if isinstance(value, str) else value
+    try:
+        return int(count)
+    except (TypeError, ValueError):
+        click.echo(f"{value} is not a valid integer.", err=True)
+        ctx.exit(1)
 
 
 @click.command(name="create", help="Create a jail.")
 @click.pass_context
 @click.option("--count", "-c", callback=validate_count, default="1",
               help="Designate a number of jails to create. Jails are"
-                   " numbered sequentially.")
+                   " created concurrently and reported as they finish.")
 @click.option("--release", "-r", required=False,
               help="Specify the RELEASE to use for the new jail.")
 @click.option("--template", "-t", required=False,
@@ -82,7 +76,7 @@ def validate_count(ctx, param, value):
 def cli(ctx, release, template, count, props, pkglist, basejail, basejail_type,
         empty, name, no_fetch, force):
 
-    zfs = iocage.lib.ZFS.get_zfs()
+    zfs = iocage.lib.ZFS.get_zfs(cached=True)
     logger = ctx.parent.logger
     host = iocage.lib.Host.Host(logger=logger, zfs=zfs)
 
@@ -96,8 +90,29 @@ def cli(ctx, release, template, count, props, pkglist, basejail, basejail_type,
         release = host.release_version
 
     if name:
+        if count > 1:
+            logger.error("Cannot set --name when creating multiple jails")
+            exit(1)
         jail_data["name"] = name
 
+    if basejail:
+        jail_data["basejail"] = True
+
+    if basejail_type is not None:
+        if not basejail:
+            logger.error(
+                "Cannot set --basejail-type without --basejail option")
+            exit(1)
+        jail_data["basejail_type"] = basejail_type
+
+    if props:
+        for prop in props:
+            key, sep, value = prop.partition("=")
+            if not sep:
+                logger.error(f"Invalid property {prop}")
+                exit(1)
+            jail_data[key] = value
+
     if release is not None:
         resource = iocage.lib.Release.ReleaseGenerator(
             name=release,
@@ -121,8 +136,13 @@ def cli(ctx, release, template, count, props, pkglist, basejail, basejail_type,
                 exit(1)
             else:
                 logger.spam(msg)
-                logger.log("Automatically fetching release '{resource.name}'")
-                resource.fetch()
+                logger.log(f"Automatically fetching release '{resource.name}'")
+                ctx.parent.print_events(resource.fetch())
+                if not resource.fetched:
+                    logger.error(
+                        f"The release '{resource.name}' could not be fetched"
+                    )
+                    exit(1)
     elif template is not None:
         resource = iocage.lib.Jail.JailGenerator(
             template,
@@ -134,45 +154,29 @@ def cli(ctx, release, template, count, props, pkglist, basejail, basejail_type,
         logger.error("No release or jail selected")
         exit(1)
 
-    if basejail:
-        jail_data["basejail"] = True
+    resource_name = resource.name
 
-    if basejail_type is not None:
-        if not basejail:
-            logger.error(
-                "Cannot set --basejail-type without --basejail option")
-            exit(1)
-        jail_data["basejail_type"] = basejail_type
-
-    if props:
-        for prop in props:
-            try:
-                key, value = prop.split("=", maxsplit=1)
-                jail_data[key] = value
-            except (ValueError, KeyError):
-                logger.error(f"Invalid property {prop}")
-                exit(1)
+    created = iocage.lib.Jail.JailGenerator.create_batch(
+        resource,
+        [jail_data] * count,
+        logger=logger
+    )
 
     errors = False
-    for i in range(count):
-
-        jail = iocage.lib.Jail.JailGenerator(
-            jail_data,
-            logger=logger,
-            host=host,
-            zfs=zfs,
-            new=True
-        )
+    for i, (jail, error) in enumerate(created, 1):
         suffix = f" ({i}/{count})" if count > 1 else ""
-        try:
-            jail.create(resource)
+        if jail is None:
+            logger.warn(f"Jail could not be created!{suffix}")
+            errors = True
+        elif error is not None:
+            msg = f"{jail.humanreadable_name} could not be created!{suffix}"
+            logger.warn(msg)
+            errors = True
+        else:
             msg = (
                 f"{jail.humanreadable_name} successfully created"
-                f" from {resource.name}!{suffix}"
+                f" from {resource_name}!{suffix}"
             )
             logger.log(msg)
-        except iocage.lib.errors.IocageException:
-            msg = f"{jail.humanreadable_name} could not be created!{suffix}"
-            logger.warn(msg)
 
     exit(int(errors))
@@ -24,6 +24,12 @@
 import typing
 import json
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 import iocage.lib.Config
 import iocage.lib.Config.Prototype
 import iocage.lib.Config.Resource.ResourceConfig
@@ -35,7 +41,11 @@ class ConfigJSON(iocage.lib.Config.Prototype.Prototype):
     config_type = "json"
 
     def map_input(self, data: typing.TextIO) -> typing.Dict[str, typing.Any]:
-        result = json.load(data)  # type: typing.Dict[str, typing.Any]
+        result: typing.Dict[str, typing.Any]
+        if HAS_ORJSON is True:
+            result = orjson.loads(data.read())
+        else:
+            result = json.load(data)
         return result
 
     def map_output(self, data: dict) -> str:
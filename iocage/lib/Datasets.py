@@ -41,7 +41,7 @@ class Datasets:
     root: libzfs.ZFSDataset
     zfs: 'iocage.lib.ZFS.ZFS'
     logger: 'iocage.lib.Logger.Logger'
-    _datasets: typing.Dict[str, libzfs.ZFSDataset] = {}
+    _datasets: typing.Dict[str, libzfs.ZFSDataset]
 
     def __init__(
         self,
@@ -53,6 +53,7 @@ class Datasets:
 
         self.logger = iocage.lib.helpers.init_logger(self, logger)
         self.zfs = iocage.lib.helpers.init_zfs(self, zfs)
+        self._datasets = {}
 
         if isinstance(root, libzfs.ZFSDataset):
             self._root = root
@@ -23,10 +23,12 @@
 # IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
 import typing
+import concurrent.futures
 import os
 import re
 import subprocess  # nosec: B404
 import shlex
+import threading
 
 import iocage.lib.Types
 import iocage.lib.errors
@@ -42,6 +44,7 @@ import iocage.lib.Release
 import iocage.lib.StandaloneJailStorage
 import iocage.lib.Storage
 import iocage.lib.ZFSBasejailStorage
+import iocage.lib.ZFS
 import iocage.lib.ZFSShareStorage
 import iocage.lib.LaunchableResource
 import iocage.lib.Config.Jail.File.Fstab
@@ -570,6 +573,146 @@ class JailGenerator(JailResource):
         else:
             self.create_from_release(release=resource)
 
+    @classmethod
+    def create_batch(
+        cls,
+        resource: typing.Union[
+            'JailGenerator',
+            'iocage.lib.Jail.ReleaseGenerator',
+        ],
+        jail_data_list: typing.List[typing.Dict[str, typing.Any]],
+        logger: typing.Optional['iocage.lib.Logger.Logger']=None,
+        max_workers: typing.Optional[int]=None
+    ) -> typing.Generator[
+        typing.Tuple[
+            typing.Optional['JailGenerator'],
+            typing.Optional[Exception]
+        ],
+        None,
+        None
+    ]:
+        """
+        Create multiple Jails from the same Resource
+
+        The jails are created concurrently. libzfs handles are not
+        thread-safe, so every worker thread opens its own ZFS handle and
+        re-instantiates the Host and the Resource on it. A single jail is
+        created in the calling thread with the Resource's own handle.
+
+        A tuple of the jail and the exception that occurred (or None on
+        success) is yielded as each creation finishes, so that one failing
+        jail does not abort the others. The jail is None when it could not
+        even be instantiated.
+
+        Args:
+
+            resource:
+                The jails are created from the provided resource.
+                This can be either another Jail or a Release.
+
+            jail_data_list (list):
+                One jail configuration dict per jail to create
+
+            logger (iocage.lib.Logger): (optional)
+                Logger shared by all jails, defaults to the resource's logger
+
+            max_workers (int): (optional)
+                Number of jails created at once, defaults to the CPU count
+        """
+        if len(jail_data_list) == 0:
+            return
+
+        batch_logger: 'iocage.lib.Logger.Logger' = (
+            logger if (logger is not None) else resource.logger
+        )
+        host = resource.host
+        root_dataset_name = host.datasets.root.name
+
+        # create the shared parent dataset before the workers race for it
+        host.datasets.jails
+
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        max_workers = min(len(jail_data_list), max_workers)
+
+        thread_local = threading.local()
+
+        def _init_thread() -> None:
+            zfs = iocage.lib.ZFS.get_zfs(logger=batch_logger, cached=True)
+            thread_host = host.__class__(
+                root_dataset=zfs.get_dataset(root_dataset_name),
+                logger=batch_logger,
+                zfs=zfs
+            )
+            thread_resource: typing.Union[
+                'JailGenerator',
+                'iocage.lib.Release.ReleaseGenerator'
+            ]
+            if isinstance(resource, JailGenerator):
+                thread_resource = resource.__class__(
+                    resource.config["id"],
+                    logger=batch_logger,
+                    host=thread_host,
+                    zfs=zfs
+                )
+            else:
+                thread_resource = resource.__class__(
+                    name=resource.name,
+                    logger=batch_logger,
+                    host=thread_host,
+                    zfs=zfs
+                )
+            thread_local.zfs = zfs
+            thread_local.host = thread_host
+            thread_local.resource = thread_resource
+
+        def _create(
+            jail_data: typing.Dict[str, typing.Any]
+        ) -> typing.Tuple[
+            typing.Optional['JailGenerator'],
+            typing.Optional[Exception]
+        ]:
+            jail: typing.Optional['JailGenerator'] = None
+            try:
+                if "zfs" not in thread_local.__dict__:
+                    _init_thread()
+
+                jail = cls(
+                    dict(jail_data),
+                    zfs=thread_local.zfs,
+                    host=thread_local.host,
+                    logger=batch_logger,
+                    new=True
+                )
+                jail.create(thread_local.resource)
+            except iocage.lib.errors.IocageException as e:
+                return jail, e
+            except Exception as e:
+                batch_logger.error(str(e), jail=jail)
+                return jail, e
+            return jail, None
+
+        if len(jail_data_list) == 1:
+            # a single jail is created on the caller's handle without a pool
+            thread_local.zfs = resource.zfs
+            thread_local.host = host
+            thread_local.resource = resource
+            yield _create(jail_data_list[0])
+            return
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+            futures = [
+                executor.submit(_create, jail_data)
+                for jail_data in jail_data_list
+            ]
+            try:
+                for future in concurrent.futures.as_completed(futures):
+                    yield future.result()
+            finally:
+                # do not create the remaining jails on interrupt or close
+                for future in futures:
+                    future.cancel()
+
     def create_from_release(
         self,
         release: iocage.lib.Release.ReleaseGenerator
@@ -92,9 +92,10 @@ class Storage:
                 self.jail.host.datasets.jails.name,
                 new_name
             ])
-            dataset = self.jail.dataset
-            dataset.rename(new_dataset_name)
-            self.jail._dataset = self.zfs.get_dataset(new_dataset_name)
+            self.jail._dataset = self.zfs.rename_dataset(
+                self.jail.dataset,
+                new_dataset_name
+            )
             self.jail.dataset_name = new_dataset_name
             self.logger.verbose(
                 f"Dataset {current_dataset_name} renamed to {new_dataset_name}"
@@ -154,7 +155,7 @@ class Storage:
             )
             if existing_dataset.mountpoint is not None:
                 existing_dataset.umount()
-            existing_dataset.delete()
+            self.zfs.delete_dataset(existing_dataset)
             del existing_dataset
 
         # delete existing snapshot if existing
@@ -180,7 +181,7 @@ class Storage:
                 f"Cloning snapshot {snapshot_name} to {target}",
                 jail=self.jail
             )
-            snapshot.clone(target)
+            self.zfs.clone_snapshot(snapshot, target)
         except libzfs.ZFSException:
             parent = "/".join(target.split("/")[:-1])
             self.logger.debug(
@@ -189,7 +190,7 @@ class Storage:
                 jail=self.jail
             )
             self.zfs.create_dataset(parent)
-            snapshot.clone(target)
+            self.zfs.clone_snapshot(snapshot, target)
 
         target_dataset = self.zfs.get_dataset(target)
         target_dataset.mount()
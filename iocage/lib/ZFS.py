@@ -69,6 +69,24 @@ class ZFS(libzfs.ZFS):
             logger=self.logger
         )
 
+    def delete_dataset(self, dataset: libzfs.ZFSDataset) -> None:
+        dataset.delete()
+
+    def rename_dataset(
+        self,
+        dataset: libzfs.ZFSDataset,
+        new_name: str
+    ) -> libzfs.ZFSDataset:
+        dataset.rename(new_name)
+        return self.get_dataset(new_name)
+
+    def clone_snapshot(
+        self,
+        snapshot: libzfs.ZFSSnapshot,
+        target: str
+    ) -> None:
+        snapshot.clone(target)
+
     def delete_dataset_recursive(
         self,
         dataset: libzfs.ZFSDataset,
@@ -100,7 +118,7 @@ class ZFS(libzfs.ZFS):
 
         if self.logger is not None:
             self.logger.verbose(f"Deleting dataset {dataset.name}")
-        dataset.delete()
+        self.delete_dataset(dataset)
 
         if origin is not None:
             if self.logger is not None:
@@ -109,11 +127,74 @@ class ZFS(libzfs.ZFS):
             origin_snapshot.delete()
 
 
+class CachedZFS(ZFS):
+    """
+    ZFS handle that memoizes pool and dataset lookups
+
+    Repeated lookups of the same dataset or pool are answered from memory
+    instead of issuing another ioctl. Only successful lookups are cached.
+    Datasets deleted, renamed or cloned through this handle are evicted,
+    while changes made behind its back are not noticed, so the handle is
+    meant to be short-lived, e.g. for a single CLI invocation.
+
+    Like libzfs.ZFS itself this handle and the datasets and pools it returns
+    are not thread-safe. Use one handle per thread.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        ZFS.__init__(self, *args, **kwargs)
+        self._datasets: typing.Dict[str, libzfs.ZFSDataset] = {}
+        self._pools: typing.Dict[str, libzfs.ZFSPool] = {}
+
+    def get_dataset(self, name: str) -> libzfs.ZFSDataset:
+        if name not in self._datasets:
+            self._datasets[name] = ZFS.get_dataset(self, name)
+        return self._datasets[name]
+
+    def get_pool(self, name: str) -> libzfs.ZFSPool:
+        pool_name = name.split("/")[0]
+        if pool_name not in self._pools:
+            self._pools[pool_name] = ZFS.get_pool(self, pool_name)
+        return self._pools[pool_name]
+
+    def delete_dataset(self, dataset: libzfs.ZFSDataset) -> None:
+        self.invalidate(dataset.name)
+        ZFS.delete_dataset(self, dataset)
+
+    def rename_dataset(
+        self,
+        dataset: libzfs.ZFSDataset,
+        new_name: str
+    ) -> libzfs.ZFSDataset:
+        self.invalidate(dataset.name)
+        self.invalidate(new_name)
+        return ZFS.rename_dataset(self, dataset, new_name)
+
+    def clone_snapshot(
+        self,
+        snapshot: libzfs.ZFSSnapshot,
+        target: str
+    ) -> None:
+        self.invalidate(target)
+        ZFS.clone_snapshot(self, snapshot, target)
+
+    def invalidate(self, dataset_name: str) -> None:
+        """
+        Evict a dataset and its children from the cache
+        """
+        prefix = f"{dataset_name}/"
+        for name in list(self._datasets.keys()):
+            if (name == dataset_name) or name.startswith(prefix):
+                del self._datasets[name]
+
+
 def get_zfs(
     logger: typing.Optional[iocage.lib.Logger.Logger]=None,
     history: bool=True,
-    history_prefix: str="<iocage>"
+    history_prefix: str="<iocage>",
+    cached: bool=False
 ) -> ZFS:
-    zfs = ZFS(history=history, history_prefix=history_prefix)
+    zfs_class = CachedZFS if (cached is True) else ZFS
+    zfs = zfs_class(history=history, history_prefix=history_prefix)
     zfs.logger = iocage.lib.helpers.init_logger(zfs, logger)
     return zfs
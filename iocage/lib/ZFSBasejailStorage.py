@@ -91,7 +91,7 @@ class ZFSBasejailStorage:
                     except libzfs.ZFSException:
                         pass
 
-                child.delete()
+                self.zfs.delete_dataset(child)
 
             else:
                 self._delete_clone_target_datasets(list(child.children))
@@ -0,0 +1,63 @@
+# Copyright (c) 2014-2017, iocage
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted providing that the following conditions
+# are met:
+# 1. Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE AUTHOR ``AS IS'' AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED.  IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR ANY
+# DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS
+# OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION)
+# HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT,
+# STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING
+# IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+import json
+
+import pytest
+
+import iocage.lib.Config.Type.JSON
+
+
+class TestConfigJSON(object):
+
+    @pytest.fixture
+    def config_file(self, tmpdir):
+        config_file = tmpdir.join("config.json")
+        config_file.write(json.dumps({
+            "id": "foo",
+            "basejail": "yes",
+            "priority": 5,
+            "ip4_addr": "vnet0|10.0.0.2/24",
+            "tags": ["a", "ü"]
+        }, indent=4))
+        return str(config_file)
+
+    @pytest.mark.parametrize("has_orjson", [False, True])
+    def test_read_is_independent_of_orjson(
+        self,
+        has_orjson,
+        config_file,
+        logger,
+        monkeypatch
+    ):
+        if has_orjson is True:
+            pytest.importorskip("orjson")
+
+        module = iocage.lib.Config.Type.JSON
+        monkeypatch.setattr(module, "HAS_ORJSON", has_orjson)
+        config = module.ConfigJSON(file=config_file, logger=logger)
+
+        with open(config_file, "r") as f:
+            expected = json.load(f)
+
+        assert config.read() == expected
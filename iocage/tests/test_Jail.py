@@ -26,6 +26,7 @@ import os
 import uuid
 
 import helper_functions
+import libzfs
 import pytest
 
 import iocage.lib.Jail
@@ -96,6 +97,46 @@ class TestJail(object):
 
         cleanup()
 
+    def test_can_be_created_in_batch(self, host, local_release, logger, zfs,
+                                     root_dataset):
+
+        results = list(iocage.lib.Jail.JailGenerator.create_batch(
+            local_release,
+            [{}, {}, {}],
+            logger=logger,
+            max_workers=2
+        ))
+
+        datasets = []
+        for jail, error in results:
+            try:
+                datasets.append(zfs.get_dataset(
+                    f"{root_dataset.name}/jails/{jail.name}"
+                ))
+            except libzfs.ZFSException:
+                pass
+
+        def cleanup():
+            for dataset in datasets:
+                helper_functions.unmount_and_destroy_dataset_recursive(dataset)
+
+        try:
+            assert len(results) == 3
+            assert all(error is None for _, error in results)
+            assert len(set(jail.name for jail, _ in results)) == 3
+            assert len(datasets) == 3
+
+            for dataset in datasets:
+                assert dataset.mountpoint is not None
+                assert os.path.isfile(f"{dataset.mountpoint}/config.json")
+                assert os.path.isdir(f"{dataset.mountpoint}/root")
+
+        except BaseException as e:
+            cleanup()
+            raise e
+
+        cleanup()
+
 
 class TestNullFSBasejail(object):
 
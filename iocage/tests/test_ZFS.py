@@ -0,0 +1,100 @@
+# Copyright (c) 2014-2017, iocage
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted providing that the following conditions
+# are met:
+# 1. Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE AUTHOR ``AS IS'' AND ANY EXPRESS OR
+# IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED.  IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR ANY
+# DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS
+# OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION)
+# HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT,
+# STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING
+# IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+import libzfs
+import pytest
+
+import iocage.lib.ZFS
+
+
+class TestCachedZFS(object):
+
+    @pytest.fixture
+    def cached_zfs(self, logger):
+        return iocage.lib.ZFS.get_zfs(logger=logger, cached=True)
+
+    @pytest.fixture
+    def get_dataset(self, mocker):
+
+        def _get_dataset(zfs, name):
+            if name.startswith("missing"):
+                raise libzfs.ZFSException(libzfs.Error.NOENT, name)
+            dataset = mocker.Mock()
+            dataset.name = name
+            return dataset
+
+        return mocker.patch.object(
+            iocage.lib.ZFS.ZFS,
+            "get_dataset",
+            side_effect=_get_dataset
+        )
+
+    def test_lookups_are_cached(self, cached_zfs, get_dataset):
+        first = cached_zfs.get_dataset("pool/a")
+        second = cached_zfs.get_dataset("pool/a")
+
+        assert first is second
+        assert get_dataset.call_count == 1
+
+    def test_failed_lookups_are_not_cached(self, cached_zfs, get_dataset):
+        for _ in range(2):
+            with pytest.raises(libzfs.ZFSException):
+                cached_zfs.get_dataset("missing/a")
+
+        assert get_dataset.call_count == 2
+
+    def test_delete_evicts_dataset_and_children(
+        self,
+        cached_zfs,
+        get_dataset
+    ):
+        dataset = cached_zfs.get_dataset("pool/a")
+        child = cached_zfs.get_dataset("pool/a/root")
+        sibling = cached_zfs.get_dataset("pool/ab")
+
+        cached_zfs.delete_dataset(dataset)
+
+        dataset.delete.assert_called_once_with()
+        assert cached_zfs.get_dataset("pool/a") is not dataset
+        assert cached_zfs.get_dataset("pool/a/root") is not child
+        assert cached_zfs.get_dataset("pool/ab") is sibling
+
+    def test_rename_evicts_old_and_new_name(self, cached_zfs, get_dataset):
+        dataset = cached_zfs.get_dataset("pool/a")
+        stale_target = cached_zfs.get_dataset("pool/b")
+
+        renamed = cached_zfs.rename_dataset(dataset, "pool/b")
+
+        dataset.rename.assert_called_once_with("pool/b")
+        assert renamed is not stale_target
+        assert renamed.name == "pool/b"
+        assert cached_zfs.get_dataset("pool/a") is not dataset
+
+    def test_clone_evicts_target(self, cached_zfs, get_dataset, mocker):
+        stale_target = cached_zfs.get_dataset("pool/b")
+        snapshot = mocker.Mock()
+
+        cached_zfs.clone_snapshot(snapshot, "pool/b")
+
+        snapshot.clone.assert_called_once_with("pool/b")
+        assert cached_zfs.get_dataset("pool/b") is not stale_target